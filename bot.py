@@ -6,9 +6,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import pathlib
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import discord
 from discord.ext import commands
@@ -18,6 +19,9 @@ from private import config
 from utils.osu_api import OsuAPI
 from utils.startup import setup_logging, wrap_task_factory
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class OsuBot(commands.Bot):
     """自定義的 Discord Bot 類別。
@@ -34,6 +38,16 @@ class OsuBot(commands.Bot):
         super().__init__(**options)
         self.osu_api_client: OsuAPI | None = None
 
+    @property
+    def http_session(self) -> aiohttp.ClientSession | None:
+        """共享的 HTTP session（由 OsuAPI 客戶端持有並管理生命週期）。
+
+        Cog 需要直接發送 HTTP 請求時應使用此 session，而不是自行建立新的 ClientSession。
+        """
+        if self.osu_api_client is None:
+            return None
+        return self.osu_api_client.session
+
     async def setup_hook(self) -> None:
         """Bot 的異步設置鉤子。
 
@@ -85,14 +99,21 @@ class OsuBot(commands.Bot):
             logger.info("沒有可載入的 Cog。")
             return
 
-        for cog_name in cog_names:
-            try:
-                await self.load_extension(f"cogs.{cog_name}")
-                logger.info("✅ 已成功載入 Cog: {cog_name}", cog_name=cog_name)
-            except commands.ExtensionAlreadyLoaded:
+        # 同時載入所有 Cog，讓各自的 setup 等待時間互相重疊
+        results = await asyncio.gather(
+            *(self.load_extension(f"cogs.{cog_name}") for cog_name in cog_names),
+            return_exceptions=True,
+        )
+
+        for cog_name, result in zip(cog_names, results, strict=True):
+            if isinstance(result, commands.ExtensionAlreadyLoaded):
                 logger.warning("⚠️ Cog {cog_name} 已經載入", cog_name=cog_name)
-            except Exception as e:
-                logger.error(f"❌ 載入 Cog {cog_name} 失敗: {e}", exc_info=True)
+            elif isinstance(result, BaseException):
+                logger.opt(exception=result).error(
+                    "❌ 載入 Cog {cog_name} 失敗: {error}", cog_name=cog_name, error=result
+                )
+            else:
+                logger.info("✅ 已成功載入 Cog: {cog_name}", cog_name=cog_name)
 
     def _discover_cog_names(self) -> list[str]:
         cogs_dir = pathlib.Path("cogs")
@@ -101,11 +122,15 @@ class OsuBot(commands.Bot):
             logger.warning("⚠️ cogs 資料夾不存在，已自動創建。")
             return []
 
-        return sorted(
-            entry.stem
-            for entry in cogs_dir.iterdir()
-            if entry.is_file() and entry.suffix == ".py" and not entry.name.startswith("_")
-        )
+        # os.scandir 的 DirEntry 會快取檔名與類型資訊，避免對每個檔案額外 stat
+        with os.scandir(cogs_dir) as it:
+            return sorted(
+                entry.name[:-3]
+                for entry in it
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("_")
+                and entry.is_file(follow_symlinks=False)
+            )
 
     async def on_ready(self) -> None:
         """當 Bot 準備就緒時觸發。"""
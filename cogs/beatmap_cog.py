@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import datetime  # 用於轉換時長
 import re  # 用於正則表達式解析 URL
 from typing import TYPE_CHECKING
 
@@ -11,6 +10,7 @@ from loguru import logger
 # from utils.osu_api_utils import get_ruleset_id_from_string, RateLimiter, get_user_id_for_l10n_from_message # REMOVED
 from utils.beatmap_utils import get_beatmap_status_display  # IMPORT THE NEW FUNCTION
 from utils.localization import get_localized_string as lstr
+from utils.localization import get_user_language
 
 if TYPE_CHECKING:
     from utils.osu_api import OsuAPI
@@ -18,6 +18,45 @@ if TYPE_CHECKING:
 # osu! 遊戲模式的映射 (與 osu_cog.py 中的類似，但這裡也需要用到)
 OSU_MODES_DISPLAY = {0: "mode_std", 1: "mode_taiko", 2: "mode_ctb", 3: "mode_mania"}
 
+# 正則表達式用於提取 osu! 譜面 ID (模組載入時編譯一次)
+# 匹配 /b/id, /beatmaps/id, /s/set_id, /beatmapsets/set_id, /beatmapsets/set_id#mode/id
+# 位置群組: 1=set_id_long, 2=map_id_long, 3=set_id_short, 4=map_id_short, 5=map_id_single
+# re.ASCII 讓 \d 只匹配 [0-9]，連結本身也只會是 ASCII
+_BEATMAP_URL_RE = re.compile(
+    r"https://osu\.ppy\.sh/(?:beatmapsets/(\d+)(?:#(?:osu|taiko|fruits|mania)/)?(\d+)?|s/(\d+)|b/(\d+)|beatmaps/(\d+))",
+    re.ASCII,
+)
+# 最短的有效譜面連結，例如 https://osu.ppy.sh/b/1
+_MIN_BEATMAP_URL_LENGTH = len("https://osu.ppy.sh/b/1")
+
+# 譜面 Embed 使用的固定標籤 {key: default_fallback}，每種語言只翻譯一次
+_BEATMAP_LABEL_KEYS = {
+    "beatmap_embed_title": "",
+    "beatmap_creator_label": "",
+    "beatmap_status_label": "",
+    "beatmap_difficulty_label": "",
+    "beatmap_stats_label": "",
+    "beatmap_length_label": "",
+    "short_playable_time_indicator": "play",
+    "beatmap_bpm_label": "",
+    "beatmap_max_combo_label": "",
+    "beatmap_id_label": "",
+    "beatmapset_id_label": "",
+}
+_beatmap_labels_cache: dict[str, dict[str, str]] = {}
+
+
+def _get_beatmap_labels(user_id: int) -> dict[str, str]:
+    """取得用戶語言的譜面 Embed 標籤，依語言代碼快取"""
+    lang_code = get_user_language(user_id)
+    labels = _beatmap_labels_cache.get(lang_code)
+    if labels is None:
+        labels = {
+            key: lstr(user_id, key, fallback) for key, fallback in _BEATMAP_LABEL_KEYS.items()
+        }
+        _beatmap_labels_cache[lang_code] = labels
+    return labels
+
 
 class BeatmapCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
@@ -25,12 +64,6 @@ class BeatmapCog(commands.Cog):
         self.osu_api: OsuAPI = bot.osu_api_client
         # self.rate_limiter = RateLimiter(calls=20, period=60) # Example limits # COMMENTED OUT
 
-        # 正則表達式用於提取 osu! 譜面 ID
-        # 匹配 /b/id, /beatmaps/id, /s/set_id, /beatmapsets/set_id, /beatmapsets/set_id#mode/id
-        self.beatmap_url_pattern = re.compile(
-            r"https://osu\.ppy\.sh/(?:beatmapsets/(?P<set_id_long>\d+)(?:#(osu|taiko|fruits|mania)/)?(?P<map_id_long>\d+)?|s/(?P<set_id_short>\d+)|b/(?P<map_id_short>\d+)|beatmaps/(?P<map_id_single>\d+))"
-        )
-
     def get_mode_name(self, mode_int: int, user_id: int) -> str:
         key = OSU_MODES_DISPLAY.get(mode_int, "mode_unknown")
         return lstr(user_id, key)
@@ -40,11 +73,10 @@ class BeatmapCog(commands.Cog):
         if not total_seconds:
             return "0:00"
         try:
-            return str(datetime.timedelta(seconds=int(total_seconds)))[
-                2:
-            ]  # 去掉小時部分 0:
-        except:
+            minutes, seconds = divmod(int(total_seconds), 60)
+        except (TypeError, ValueError):
             return "N/A"
+        return f"{minutes}:{seconds:02d}"
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
@@ -52,12 +84,21 @@ class BeatmapCog(commands.Cog):
         if message.author.bot:
             return
 
+        # 空訊息 (例如只有附件) 或短於最短譜面連結的訊息不可能匹配
+        content = message.content
+        if len(content) < _MIN_BEATMAP_URL_LENGTH:
+            return
+
+        # 絕大多數訊息不含 osu! 連結，先以子字串檢查快速略過，避免執行正則表達式
+        if "osu.ppy.sh" not in content:
+            return
+
         # 檢查機器人是否被提及 (不是必要條件，按需調整)
         # if not self.bot.user.mentioned_in(message):
         #     return
 
         # 從訊息內容中查找 URL
-        match = self.beatmap_url_pattern.search(message.content)
+        match = _BEATMAP_URL_RE.search(content)
         if not match:
             # 如果要求必須提及才觸發，可以在這裡回覆一個提示，例如:
             # if self.bot.user.mentioned_in(message):
@@ -65,21 +106,35 @@ class BeatmapCog(commands.Cog):
             return
 
         # 提取 ID
-        beatmap_id_str = (
-            match.group("map_id_long")
-            or match.group("map_id_short")
-            or match.group("map_id_single")
-        )
-        beatmapset_id_str = match.group("set_id_long") or match.group("set_id_short")
+        set_id_long, map_id_long, set_id_short, map_id_short, map_id_single = match.groups()
+        beatmap_id_str = map_id_long or map_id_short or map_id_single
+        beatmapset_id_str = set_id_long or set_id_short
 
         user_id_for_l10n = message.author.id
+        labels = _get_beatmap_labels(user_id_for_l10n)
         beatmap_data_list = []  # Initialize as empty list
         target_beatmap_from_direct_id = None  # Used if beatmap_id_str is present
-
-        if beatmap_id_str:
+        beatmapset_data = None  # Set when the beatmapset itself was fetched
+        osu_api = self.osu_api
+
+        if beatmap_id_str and beatmapset_id_str:
+            # /beatmapsets/set_id#mode/map_id: the difficulty response already nests its
+            # beatmapset, so the whole set is only fetched when that lookup fails or lacks it.
+            beatmap_detail = await osu_api.get_beatmap_details(beatmap_id=int(beatmap_id_str))
+            if beatmap_detail:
+                target_beatmap_from_direct_id = beatmap_detail
+                beatmap_data_list = [beatmap_detail]
+            if not beatmap_detail or not beatmap_detail.get("beatmapset"):
+                beatmapset_data = await osu_api.get_beatmapset(
+                    beatmapset_id=int(beatmapset_id_str)
+                )
+                # Difficulty lookup failed: find it in the set's difficulty list instead
+                if not beatmap_data_list and beatmapset_data and beatmapset_data.get("beatmaps"):
+                    beatmap_data_list = beatmapset_data["beatmaps"]
+        elif beatmap_id_str:
             try:
                 beatmap_id = int(beatmap_id_str)
-                beatmap_detail = await self.osu_api.get_beatmap_details(
+                beatmap_detail = await osu_api.get_beatmap_details(
                     beatmap_id=beatmap_id
                 )
                 if beatmap_detail:
@@ -94,7 +149,7 @@ class BeatmapCog(commands.Cog):
         elif beatmapset_id_str:
             try:
                 beatmapset_id = int(beatmapset_id_str)
-                beatmapset_data = await self.osu_api.get_beatmapset(
+                beatmapset_data = await osu_api.get_beatmapset(
                     beatmapset_id=beatmapset_id
                 )
                 # beatmapset_data for API v2 contains a 'beatmaps' key with list of difficulties
@@ -109,19 +164,9 @@ class BeatmapCog(commands.Cog):
                 # Invalid beatmapset_id format
                 pass  # beatmap_data_list remains empty
 
-        if not beatmap_data_list:  # If list is empty after trying to fetch
-            # Consider a more specific localization key like "beatmap_api_error_or_not_found"
-            if self.bot.user.mentioned_in(message):
-                await message.reply(
-                    lstr(user_id_for_l10n, "beatmap_api_error"), mention_author=False
-                )
-            return
-
+        # An empty beatmap_data_list (API error / not found) leaves target_beatmap as None,
+        # so both failure cases share the single mentioned_in check below.
         target_beatmap = None
-        # num_diffs_in_set was len(beatmap_data_list) before. It's used for footer.
-        # If beatmap_id_str was given, beatmap_data_list has at most 1 item.
-        # If beatmapset_id_str was given, beatmap_data_list has all diffs.
-        len(beatmap_data_list)
 
         if beatmap_id_str:  # If URL directly pointed to a specific difficulty
             if (
@@ -131,13 +176,11 @@ class BeatmapCog(commands.Cog):
                 target_beatmap = target_beatmap_from_direct_id
             # Fallback: if somehow target_beatmap_from_direct_id wasn't set or ID mismatched
             # This part of the logic might be redundant if target_beatmap_from_direct_id is reliable
-            elif beatmap_data_list:
-                for bm in (
-                    beatmap_data_list
-                ):  # Should be a list of one if direct fetch worked
-                    if str(bm.get("id")) == beatmap_id_str:  # API v2 beatmap id is 'id'
-                        target_beatmap = bm
-                        break
+            else:  # API v2 beatmap id is 'id'
+                target_beatmap = next(
+                    (bm for bm in beatmap_data_list if str(bm.get("id")) == beatmap_id_str),
+                    None,
+                )
             # If beatmap_id_str was provided but target_beatmap is still None,
             # it means the specific map wasn't found or API failed for it.
             # The old code did: if not target_beatmap: target_beatmap = beatmap_data_list[0]
@@ -145,21 +188,16 @@ class BeatmapCog(commands.Cog):
             # Let's rely on the "if not target_beatmap:" check below.
 
         elif beatmap_data_list:  # Ensure list is not empty
-            # Try to find osu!standard (ruleset_id 0)
-            for bm in beatmap_data_list:
-                if (
-                    bm.get("ruleset_id") == 0
-                ):  # API v2 uses 'ruleset_id' for mode integer
-                    target_beatmap = bm
-                    break
-            if (
-                not target_beatmap
-            ):  # If no osu!standard, take the first one in the list
-                target_beatmap = beatmap_data_list[0]
+            # Prefer osu!standard (API v2 'ruleset_id' 0), otherwise take the first difficulty
+            target_beatmap = next(
+                (bm for bm in beatmap_data_list if bm.get("ruleset_id") == 0),
+                beatmap_data_list[0],
+            )
             # If beatmap_data_list was empty, target_beatmap remains None
 
         if not target_beatmap:
-            # Consider a more specific localization key like "beatmap_not_found_in_set"
+            # Consider more specific localization keys like "beatmap_api_error_or_not_found"
+            # or "beatmap_not_found_in_set"
             if self.bot.user.mentioned_in(message):
                 await message.reply(
                     lstr(user_id_for_l10n, "beatmap_api_error"), mention_author=False
@@ -175,11 +213,12 @@ class BeatmapCog(commands.Cog):
 
         current_beatmapset_data = target_beatmap.get(
             "beatmapset"
-        )  # This should be a nested object
+        ) or beatmapset_data  # Nested object, or the set we fetched ourselves
         if not current_beatmapset_data:
             current_beatmapset_data = {}  # Fallback to avoid errors, though this indicates an issue
             logger.warning(
-                f"[BeatmapCog] target_beatmap for id {target_beatmap.get('id')} missing 'beatmapset' field."
+                "[BeatmapCog] target_beatmap for id {beatmap_id} missing 'beatmapset' field.",
+                beatmap_id=target_beatmap.get("id"),
             )
 
         title = current_beatmapset_data.get("title", "N/A")
@@ -273,64 +312,73 @@ class BeatmapCog(commands.Cog):
             url=beatmap_url,
             color=0xFF69B4,  # Pink, or choose based on status
         )
-        embed.set_author(name=lstr(user_id_for_l10n, "beatmap_embed_title"))
+        embed.set_author(name=labels["beatmap_embed_title"])
         embed.set_thumbnail(url=beatmap_cover_url)
 
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_creator_label"),
+            name=labels["beatmap_creator_label"],
             value=f"[{creator}](https://osu.ppy.sh/u/{creator_id})"
             if creator_id
             else creator,
             inline=True,
         )
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_status_label"),
+            name=labels["beatmap_status_label"],
             value=f"{status_display_string_on_message} ({mode_name})",
             inline=True,
         )
 
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_difficulty_label"),
+            name=labels["beatmap_difficulty_label"],
             value=f"{stars:.2f} ★",
             inline=True,
         )
 
         stats_text = f"CS: `{cs}` AR: `{ar}` OD: `{od}` HP: `{hp}`"
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_stats_label"),
+            name=labels["beatmap_stats_label"],
             value=stats_text,
             inline=False,
         )
 
-        length_formatted = f"{self.format_length(total_length, user_id_for_l10n)} ({self.format_length(hit_length, user_id_for_l10n)} {lstr(user_id_for_l10n, 'short_playable_time_indicator', default_fallback='play')})"
+        length_formatted = f"{self.format_length(total_length, user_id_for_l10n)} ({self.format_length(hit_length, user_id_for_l10n)} {labels['short_playable_time_indicator']})"
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_length_label"),
+            name=labels["beatmap_length_label"],
             value=length_formatted,
             inline=True,
         )
         embed.add_field(
-            name=lstr(user_id_for_l10n, "beatmap_bpm_label"),
+            name=labels["beatmap_bpm_label"],
             value=f"{bpm:.0f}",
             inline=True,
         )
         if max_combo:
             embed.add_field(
-                name=lstr(user_id_for_l10n, "beatmap_max_combo_label"),
+                name=labels["beatmap_max_combo_label"],
                 value=f"{max_combo}x",
                 inline=True,
             )
         else:  # Create a placeholder field if max_combo is None or 0
             embed.add_field(
-                name=lstr(user_id_for_l10n, "beatmap_max_combo_label"),
+                name=labels["beatmap_max_combo_label"],
                 value="N/A",
                 inline=True,
             )
 
         # 頁腳
-        footer_text = f"{lstr(user_id_for_l10n, 'beatmap_id_label')}: {b_id} | {lstr(user_id_for_l10n, 'beatmapset_id_label')}: {bs_id}"
+        footer_parts = [
+            f"{labels['beatmap_id_label']}: {b_id} | {labels['beatmapset_id_label']}: {bs_id}"
+        ]
         if not beatmap_id_str and num_diffs_to_report_in_footer > 1:
-            footer_text += f"\n{lstr(user_id_for_l10n, 'beatmap_multiple_difficulties_footer', num_diffs_to_report_in_footer)}"
-        embed.set_footer(text=footer_text)
+            footer_parts.append(
+                lstr(
+                    user_id_for_l10n,
+                    "beatmap_multiple_difficulties_footer",
+                    "",
+                    num_diffs_to_report_in_footer,
+                )
+            )
+        embed.set_footer(text="\n".join(footer_parts))
 
         await message.reply(embed=embed, mention_author=False)
 
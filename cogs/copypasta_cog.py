@@ -20,13 +20,16 @@ class CopypastaCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.copypastas = {}  # This will store { "EN": {"key": "val"}, "zh_TW": ... }
+        # Pre-materialized non-empty copypastas per language: { "EN": ("val", ...), ... }
+        self._pasta_lists: dict[str, tuple[str, ...]] = {}
         self.load_copypastas()
 
     def load_copypastas(self) -> None:
         try:
-            if pathlib.Path(COPASTA_FILE).exists():
-                with pathlib.Path(COPASTA_FILE).open(encoding="utf-8") as f:
-                    loaded_data = json.load(f)
+            copypasta_path = pathlib.Path(COPASTA_FILE)
+            if copypasta_path.exists():
+                # Read the whole file in one call and let json decode the UTF-8 bytes directly
+                loaded_data = json.loads(copypasta_path.read_bytes())
                 # Basic validation for the new structure
                 if isinstance(loaded_data, dict) and all(
                     isinstance(v, dict) for v in loaded_data.values()
@@ -58,19 +61,24 @@ class CopypastaCog(commands.Cog):
             )
             self.copypastas = {}
 
+        # Build the per-language choice lists once so each command is a lookup + random.choice
+        self._pasta_lists = {
+            lang: tuple(v for v in pastas.values() if isinstance(v, str) and v.strip())
+            for lang, pastas in self.copypastas.items()
+        }
+
     @app_commands.command(
         name="copypasta",
         description="Sends a random copypasta based on your language preference.",
     )
     async def send_copypasta(self, interaction: discord.Interaction) -> None:
+        # Copypastas are loaded once at cog init; an empty catalog isn't re-read from disk here
         if not self.copypastas:
-            self.load_copypastas()  # Try reloading
-            if not self.copypastas:
-                await interaction.response.send_message(
-                    "I couldn't find any copypastas to share right now! The collection might be empty or improperly configured.",
-                    ephemeral=True,
-                )
-                return
+            await interaction.response.send_message(
+                "I couldn't find any copypastas to share right now! The collection might be empty or improperly configured.",
+                ephemeral=True,
+            )
+            return
 
         user_id = str(interaction.user.id)
         preferred_lang = get_user_language(
@@ -83,38 +91,39 @@ class CopypastaCog(commands.Cog):
         # It's better to use a specific default for copypasta source, e.g., "EN".
         copypasta_default_lang_key = DEFAULT_LANG_KEY  # Our "EN"
 
-        pastas_to_choose_from = []
-
         # 1. Try preferred language
-        if self.copypastas.get(preferred_lang):
-            pastas_to_choose_from = list(self.copypastas[preferred_lang].values())
+        pastas_to_choose_from = self._pasta_lists.get(preferred_lang)
+        if pastas_to_choose_from:
             logger.debug(
-                f"[CopypastaCog] User {user_id} prefers {preferred_lang}. Found {len(pastas_to_choose_from)} pastas."
+                "[CopypastaCog] User {user_id} prefers {lang}. Found {count} pastas.",
+                user_id=user_id,
+                lang=preferred_lang,
+                count=len(pastas_to_choose_from),
             )
 
         # 2. If preferred language had no pastas (or lang key didn't exist) AND it's not the copypasta default, try copypasta default
         if not pastas_to_choose_from and preferred_lang != copypasta_default_lang_key:
-            if (
-                self.copypastas.get(copypasta_default_lang_key)
-            ):
-                pastas_to_choose_from = list(
-                    self.copypastas[copypasta_default_lang_key].values()
-                )
+            pastas_to_choose_from = self._pasta_lists.get(copypasta_default_lang_key)
+            if pastas_to_choose_from:
                 logger.debug(
-                    f"[CopypastaCog] User {user_id} preferred {preferred_lang} (no pastas), falling back to {copypasta_default_lang_key}. Found {len(pastas_to_choose_from)} pastas."
+                    "[CopypastaCog] User {user_id} preferred {lang} (no pastas), falling back to {fallback}. Found {count} pastas.",
+                    user_id=user_id,
+                    lang=preferred_lang,
+                    fallback=copypasta_default_lang_key,
+                    count=len(pastas_to_choose_from),
                 )
             else:  # Copypasta default language itself has no pastas or key doesn't exist
                 logger.debug(
-                    f"[CopypastaCog] User {user_id} preferred {preferred_lang} (no pastas). Fallback {copypasta_default_lang_key} also has no pastas or key missing."
+                    "[CopypastaCog] User {user_id} preferred {lang} (no pastas). Fallback {fallback} also has no pastas or key missing.",
+                    user_id=user_id,
+                    lang=preferred_lang,
+                    fallback=copypasta_default_lang_key,
                 )
 
         # 3. If still no pastas (e.g., preferred was the default and it was empty, or fallback was also empty)
         if not pastas_to_choose_from:
             # Check if the default key even exists to give a more specific message
-            if (
-                copypasta_default_lang_key not in self.copypastas
-                or not self.copypastas[copypasta_default_lang_key]
-            ):
+            if not self._pasta_lists.get(copypasta_default_lang_key):
                 await interaction.response.send_message(
                     f"Sorry, I don't have any copypastas available, not even in the default language ({copypasta_default_lang_key}).",
                     ephemeral=True,
@@ -126,14 +135,8 @@ class CopypastaCog(commands.Cog):
                 )
             return
 
+        # Empty entries (e.g. "CN1": "") were filtered out in load_copypastas
         chosen_copypasta = random.choice(pastas_to_choose_from)
-        # Ensure the chosen pasta is not empty (e.g. if "CN1": "" was chosen)
-        if not chosen_copypasta.strip():
-            await interaction.response.send_message(
-                "I picked a copypasta, but it seems to be empty! Please try again, or ask the admin to check the content.",
-                ephemeral=True,
-            )
-            return
 
         # 發送 copypasta 並追蹤觸發者
         await interaction.response.defer()  # 延遲響應以獲取訊息對象
@@ -144,8 +147,9 @@ class CopypastaCog(commands.Cog):
         tracker.track_message(sent_message.id, interaction.user.id)
 
         logger.debug(
-            f"[CopypastaCog] User {interaction.user.id} triggered copypasta "
-            f"(Message ID: {sent_message.id})"
+            "[CopypastaCog] User {user_id} triggered copypasta (Message ID: {message_id})",
+            user_id=interaction.user.id,
+            message_id=sent_message.id,
         )
 
 
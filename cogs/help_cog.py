@@ -10,6 +10,7 @@ from discord.ext import commands
 from loguru import logger
 
 from utils.localization import get_localized_string as lstr
+from utils.localization import get_localized_string_or_none as lstr_or_none
 from utils.localization import get_user_language
 
 if TYPE_CHECKING:
@@ -31,11 +32,16 @@ DESIRED_COMMAND_ORDER = [
     "keyword add",
     "keyword list",
 ]
+# Command path -> position in DESIRED_COMMAND_ORDER, for O(1) sort keys
+_ORDER_INDEX = {name: index for index, name in enumerate(DESIRED_COMMAND_ORDER)}
 
 
 class HelpCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # lang_code -> rendered help embed. The command tree is fixed once the bot is
+        # running, so the embed only depends on the language; reloading the cog resets it.
+        self._embed_cache: dict[str, discord.Embed] = {}
 
     @app_commands.command(
         name="help",
@@ -51,15 +57,6 @@ class HelpCog(commands.Cog):
             f"[HelpCog] user_id_for_l10n: {user_id_for_l10n}, Detected lang_code for l10n: {current_lang_code}"
         )
 
-        test_title_key = "help_embed_title"
-        english_fallback_title = "Available Slash Commands (Fallback)"
-        localized_title_test = lstr(
-            user_id_for_l10n, test_title_key, english_fallback_title
-        )
-        logger.debug(
-            f"[HelpCog] Attempted lstr for '{test_title_key}': '{localized_title_test}'"
-        )
-
         try:
             await interaction.response.defer(ephemeral=True)
         except Exception as e_defer:
@@ -71,6 +68,37 @@ class HelpCog(commands.Cog):
                 )
             return
 
+        embed = self._embed_cache.get(current_lang_code)
+        if embed is None:
+            embed = self._build_help_embed(user_id_for_l10n)
+            self._embed_cache[current_lang_code] = embed
+        else:
+            logger.debug(f"[HelpCog] Using cached help embed for lang_code: {current_lang_code}")
+
+        try:
+            await interaction.followup.send(embed=embed)
+        except Exception as e_send:
+            logger.error(f"[HelpCog] Failed to send help embed: {e_send}")
+            # Try to send a simple text message if embed fails
+            try:
+                fallback_text = (
+                    embed.description
+                    or "Could not display help commands as an embed. Please check logs."
+                )
+                await interaction.followup.send(fallback_text, ephemeral=True)
+            except Exception:
+                logger.exception("[HelpCog] Failed to send plain-text help fallback")
+
+    def _build_help_embed(self, user_id_for_l10n: str) -> discord.Embed:
+        test_title_key = "help_embed_title"
+        english_fallback_title = "Available Slash Commands (Fallback)"
+        localized_title_test = lstr(
+            user_id_for_l10n, test_title_key, english_fallback_title
+        )
+        logger.debug(
+            f"[HelpCog] Attempted lstr for '{test_title_key}': '{localized_title_test}'"
+        )
+
         embed_title = localized_title_test
         embed = discord.Embed(title=embed_title, color=discord.Color.blue())
 
@@ -78,43 +106,34 @@ class HelpCog(commands.Cog):
         logger.debug(f"[HelpCog] Fetched {len(all_app_commands)} app commands.")
 
         # Sort commands according to DESIRED_COMMAND_ORDER
-        def sort_key(cmd_path: str) -> int:
-            try:
-                return DESIRED_COMMAND_ORDER.index(cmd_path)
-            except ValueError:
-                return len(DESIRED_COMMAND_ORDER)  # Put commands not in the list at the end
-
-        flattened_commands = list(_flatten_app_commands(all_app_commands))
-        sorted_commands = sorted(flattened_commands, key=lambda item: sort_key(item[0]))
+        # (commands not in the list go at the end)
+        unlisted_index = len(_ORDER_INDEX)
+        sorted_commands = sorted(
+            _flatten_app_commands(all_app_commands),
+            key=lambda item: _ORDER_INDEX.get(item[0], unlisted_index),
+        )
         logger.debug(
             f"[HelpCog] Sorted commands: {[cmd_path for cmd_path, _, _ in sorted_commands]}"
         )
 
+        no_description_text = lstr(
+            user_id_for_l10n, "help_no_description", "No description available."
+        )
+
         commands_to_display = []
         for i, (cmd_path, cmd_name, cmd_description) in enumerate(sorted_commands):
             logger.debug(
                 f"[HelpCog] Processing command {i + 1}/{len(sorted_commands)}: {cmd_path}"
             )
-            description_text = cmd_description
-            if not description_text or description_text == "...":
-                description_text = lstr(
-                    user_id_for_l10n,
-                    "help_no_description",
-                    "No description available.",
-                )
-
-            localized_desc_key = f"cmd_desc_{cmd_name.lower().replace(' ', '_')}"
-            original_cmd_description = description_text or lstr(
-                user_id_for_l10n, "help_no_description", "No description available."
+            original_cmd_description = (
+                cmd_description
+                if cmd_description and cmd_description != "..."
+                else no_description_text
             )
-            localized_description = lstr(
-                user_id_for_l10n, localized_desc_key, original_cmd_description
+            localized_desc_key = f"cmd_desc_{cmd_name.lower().replace(' ', '_')}"
+            localized_description = (
+                lstr_or_none(user_id_for_l10n, localized_desc_key) or original_cmd_description
             )
-            if (
-                "<translation_missing" in localized_description
-                or localized_description == localized_desc_key
-            ):
-                localized_description = original_cmd_description
 
             commands_to_display.append(f"`/{cmd_path}`: {localized_description}")
             logger.debug(
@@ -128,20 +147,7 @@ class HelpCog(commands.Cog):
                 user_id_for_l10n, "help_no_commands_found", "No slash commands found."
             )
 
-        try:
-            await interaction.followup.send(embed=embed)
-        except Exception as e_send:
-            logger.error(f"[HelpCog] Failed to send help embed: {e_send}")
-            # Try to send a simple text message if embed fails
-            try:
-                fallback_text = (
-                    "Could not display help commands as an embed. Please check logs."
-                )
-                if commands_to_display:
-                    fallback_text = "\n".join(commands_to_display)
-                await interaction.followup.send(fallback_text, ephemeral=True)
-            except Exception:
-                logger.exception("[HelpCog] Failed to send plain-text help fallback")
+        return embed
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+import types
+import unittest
+
+stub_config = types.ModuleType("private.config")
+setattr(stub_config, "DEFAULT_LANGUAGE", "en")
+setattr(stub_config, "SUPPORTED_LANGUAGES", ["en", "zh_TW"])
+sys.modules["private.config"] = stub_config
+
+from cogs.beatmap_cog import _BEATMAP_URL_RE
+
+
+def _regex_ids(content: str) -> tuple[str | None, str | None]:
+    match = _BEATMAP_URL_RE.search(content)
+    if not match:
+        return None, None
+    set_id_long, map_id_long, set_id_short, map_id_short, map_id_single = match.groups()
+    return map_id_long or map_id_short or map_id_single, set_id_long or set_id_short
+
+
+class BeatmapUrlRegexTests(unittest.TestCase):
+    def test_extracts_ids_from_supported_url_forms(self) -> None:
+        samples = {
+            "https://osu.ppy.sh/b/1": ("1", None),
+            "https://osu.ppy.sh/beatmaps/129891": ("129891", None),
+            "https://osu.ppy.sh/s/39804": (None, "39804"),
+            "https://osu.ppy.sh/beatmapsets/39804": (None, "39804"),
+            "https://osu.ppy.sh/beatmapsets/39804#osu/129891": ("129891", "39804"),
+            "https://osu.ppy.sh/beatmapsets/39804#mania/129891 nice map": ("129891", "39804"),
+            "look at this https://osu.ppy.sh/beatmapsets/39804#fruits/": (None, "39804"),
+            "https://osu.ppy.sh/users/2 then https://osu.ppy.sh/b/75": ("75", None),
+            "https://osu.ppy.sh/users/2": (None, None),
+            "https://osu.ppy.sh/b/": (None, None),
+        }
+        for content, expected in samples.items():
+            with self.subTest(content=content):
+                self.assertEqual(_regex_ids(content), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -147,17 +147,8 @@ def set_user_language(user_id: int | str, lang_code: str) -> bool:
     return True
 
 
-def get_localized_string(
-    user_id_or_lang_code: int | str | None,
-    key: str,
-    default_fallback: str = "",
-    *args,
-    **kwargs,
-) -> str:
-    """根據用戶的語言偏好或預設語言獲取翻譯後的文本。
-
-    如果 user_id 為 None，則直接使用預設語言。
-    """
+def _resolve_lang_code(user_id_or_lang_code: int | str | None) -> str:
+    """將 user_id 或語言代碼解析為已加載的語言代碼，無法解析時返回預設語言"""
     lang_code = config.DEFAULT_LANGUAGE
     if isinstance(user_id_or_lang_code, (int, str)):
         # Try to treat as user_id first
@@ -169,9 +160,45 @@ def get_localized_string(
         ):  # Else, if it was a direct lang_code string
             lang_code = str(user_id_or_lang_code)
         # If neither, lang_code remains DEFAULT_LANGUAGE
-    elif user_id_or_lang_code is None:
-        # lang_code remains DEFAULT_LANGUAGE as initialized
-        pass
+    return lang_code
+
+
+def _lookup_translation(lang_code: str, key: str) -> str | None:
+    """查找原始翻譯字串，找不到時回退到預設語言；兩者皆無則返回 None"""
+    localized_string = _translations.get(lang_code, {}).get(key)
+    # Try fallback to default language (e.g., English) if not already using it
+    if (
+        localized_string is None
+        and lang_code != config.DEFAULT_LANGUAGE
+        and config.DEFAULT_LANGUAGE in _translations
+    ):
+        localized_string = _translations[config.DEFAULT_LANGUAGE].get(key)
+    return localized_string
+
+
+def get_localized_string_or_none(
+    user_id_or_lang_code: int | str | None, key: str
+) -> str | None:
+    """與 get_localized_string 相同的語言解析，但翻譯缺失時返回 None。
+
+    不進行格式化，也不產生 "<translation_missing: ...>" 佔位字串，
+    讓呼叫端以簡單的條件判斷處理缺失的翻譯。
+    """
+    return _lookup_translation(_resolve_lang_code(user_id_or_lang_code), key)
+
+
+def get_localized_string(
+    user_id_or_lang_code: int | str | None,
+    key: str,
+    default_fallback: str = "",
+    *args,
+    **kwargs,
+) -> str:
+    """根據用戶的語言偏好或預設語言獲取翻譯後的文本。
+
+    如果 user_id 為 None，則直接使用預設語言。
+    """
+    lang_code = _resolve_lang_code(user_id_or_lang_code)
 
     # Ensure _translations is populated
     if not _translations:
@@ -188,27 +215,17 @@ def get_localized_string(
                 default_fallback or f"<missing_translations_for_key: {key}>"
             )
 
-    localized_string = _translations.get(lang_code, {}).get(key)
+    localized_string = _lookup_translation(lang_code, key)
 
+    # If not found in the user's or the default language, use the provided default_fallback
     if localized_string is None:
-        # Try fallback to default language (e.g., English) if not already using it
-        if (
-            lang_code != config.DEFAULT_LANGUAGE
-            and config.DEFAULT_LANGUAGE in _translations
-        ):
-            localized_string = _translations[config.DEFAULT_LANGUAGE].get(key)
-
-        # If still not found, use the provided default_fallback
-        if localized_string is None:
-            localized_string = default_fallback
-            # If default_fallback was also empty, it means the key is truly missing.
-            if (
-                not localized_string
-            ):  # Checks if default_fallback was also empty or None
-                logger.warning(
-                    f"[L10N] Key '{key}' not found in lang '{lang_code}' or default '{config.DEFAULT_LANGUAGE}', and no fallback string provided. Returning placeholder."
-                )
-                return f"<translation_missing: {key}>"
+        localized_string = default_fallback
+        # If default_fallback was also empty, it means the key is truly missing.
+        if not localized_string:  # Checks if default_fallback was also empty or None
+            logger.warning(
+                f"[L10N] Key '{key}' not found in lang '{lang_code}' or default '{config.DEFAULT_LANGUAGE}', and no fallback string provided. Returning placeholder."
+            )
+            return f"<translation_missing: {key}>"
 
     try:
         # DEBUGGING LOG STATEMENT
@@ -242,6 +259,7 @@ for lang in config.SUPPORTED_LANGUAGES:
 
 # Alias for convenience
 lstr = get_localized_string
+lstr_or_none = get_localized_string_or_none
 
 # 方便 cogs 或 bot 直接使用的函數 (如果不想處理 user_id)
 # 但通常建議在 cog 命令中傳遞 ctx.author.id
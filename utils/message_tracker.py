@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 from loguru import logger
 
 
@@ -26,7 +28,7 @@ class MessageTracker:
         Args:
             max_size: 最大記錄數量，超過後自動清理最舊的記錄
         """
-        self._messages: dict[int, int] = {}  # {message_id: user_id}
+        self._messages: OrderedDict[int, int] = OrderedDict()  # {message_id: user_id}
         self.max_size = max_size
 
     def track_message(self, message_id: int, user_id: int) -> None:
@@ -36,11 +38,13 @@ class MessageTracker:
             message_id: 訊息 ID
             user_id: 觸發者用戶 ID
         """
+        messages = self._messages
         # 如果超過最大容量，清理最舊的 10% 記錄
-        if len(self._messages) >= self.max_size:
+        if message_id not in messages and len(messages) >= self.max_size:
             self._cleanup_old_messages()
 
-        self._messages[message_id] = user_id
+        messages[message_id] = user_id
+        messages.move_to_end(message_id)  # 重複追蹤時視為最新記錄
         logger.debug(f"📝 追蹤訊息: message_id={message_id}, user_id={user_id}")
 
     def get_trigger_user(self, message_id: int) -> int | None:
@@ -68,11 +72,10 @@ class MessageTracker:
         """清理最舊的 10% 記錄"""
         cleanup_count = max(1, self.max_size // 10)
 
-        # 獲取最舊的記錄（字典保持插入順序）
-        old_messages = list(self._messages.keys())[:cleanup_count]
-
-        for message_id in old_messages:
-            del self._messages[message_id]
+        # OrderedDict 由舊到新排列，逐筆從開頭彈出，不需複製整個鍵列表
+        popitem = self._messages.popitem
+        for _ in range(min(cleanup_count, len(self._messages))):
+            popitem(last=False)
 
         logger.info(
             f"🧹 清理了 {cleanup_count} 條舊訊息記錄 (剩餘: {len(self._messages)})"
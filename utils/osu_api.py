@@ -24,7 +24,9 @@ class OsuAPI:
     async def setup(self) -> None:
         """初始化 aiohttp.ClientSession"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # 所有 cog 共用這個 session，保持連線與 DNS 快取以避免重複的 TLS 握手
+            connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=75)
+            self.session = aiohttp.ClientSession(connector=connector)
 
     async def close(self) -> None:
         """關閉 aiohttp.ClientSession"""